@@ -11,7 +11,14 @@ from bubus import EventBus
 from cdp_use import CDPClient
 from cdp_use.cdp.fetch import AuthRequiredEvent, RequestPausedEvent
 from cdp_use.cdp.network import Cookie
-from cdp_use.cdp.target import AttachedToTargetEvent, SessionID, TargetID
+from cdp_use.cdp.target import (
+	AttachedToTargetEvent,
+	SessionID,
+	TargetCreatedEvent,
+	TargetDestroyedEvent,
+	TargetID,
+	TargetInfoChangedEvent,
+)
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from uuid_extensions import uuid7str
 
@@ -346,6 +353,7 @@ class BrowserSession(BaseModel):
 	_cached_browser_state_summary: Any = PrivateAttr(default=None)
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
+	_known_targets: dict[TargetID, TargetInfo] | None = PrivateAttr(default=None)  # Kept up to date by Target discovery events
 
 	# Watchdogs
 	_crash_watchdog: Any | None = PrivateAttr(default=None)
@@ -407,6 +415,7 @@ class BrowserSession(BaseModel):
 		self._cdp_session_pool.clear()
 
 		self._cdp_client_root = None  # type: ignore
+		self._known_targets = None
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
 		self._downloaded_files.clear()
@@ -1344,6 +1353,9 @@ class BrowserSession(BaseModel):
 			)
 			self.logger.debug('CDP client connected successfully')
 
+			# Track target URLs from discovery events so hot paths can read them without a Target.getTargets round-trip
+			await self._setup_target_discovery()
+
 			# Get browser targets to find available contexts/pages
 			targets = await self._cdp_client_root.send.Target.getTargets()
 
@@ -2379,6 +2391,44 @@ class BrowserSession(BaseModel):
 			)
 		]
 
+	async def _cdp_get_known_pages(self) -> list[TargetInfo]:
+		"""Get all browser pages/tabs, from the locally tracked targets when Target discovery is active.
+
+		Same filtering as _cdp_get_all_pages() with its defaults, but without a Target.getTargets round-trip.
+		"""
+		if self._known_targets is None:
+			return await self._cdp_get_all_pages()
+		return [t for t in self._known_targets.values() if self._is_valid_target(t, include_iframes=False)]
+
+	async def _setup_target_discovery(self) -> None:
+		"""Keep _known_targets in sync with the browser via Target.targetCreated/targetInfoChanged/targetDestroyed."""
+		assert self._cdp_client_root is not None
+
+		known_targets: dict[TargetID, TargetInfo] = {}
+
+		def _on_target_created(event: TargetCreatedEvent, session_id: SessionID | None = None) -> None:
+			known_targets[event['targetInfo']['targetId']] = event['targetInfo']
+
+		def _on_target_info_changed(event: TargetInfoChangedEvent, session_id: SessionID | None = None) -> None:
+			known_targets[event['targetInfo']['targetId']] = event['targetInfo']
+
+		def _on_target_destroyed(event: TargetDestroyedEvent, session_id: SessionID | None = None) -> None:
+			known_targets.pop(event['targetId'], None)
+
+		try:
+			# RESERVED: cdp_use keeps a single handler per CDP method, so these three root-client events belong to this
+			# tracker. Registering any of them elsewhere silently replaces these handlers and leaves _known_targets stale.
+			self._cdp_client_root.register.Target.targetCreated(_on_target_created)
+			self._cdp_client_root.register.Target.targetInfoChanged(_on_target_info_changed)
+			self._cdp_client_root.register.Target.targetDestroyed(_on_target_destroyed)
+			# Chrome replays targetCreated for every existing target once discovery is enabled,
+			# only pages are tracked so iframes/workers don't generate events we'd just ignore
+			await self._cdp_client_root.send.Target.setDiscoverTargets(params={'discover': True, 'filter': [{'type': 'page'}]})
+			self._known_targets = known_targets
+		except Exception as e:
+			# Fall back to querying Target.getTargets on demand
+			self.logger.debug(f'Failed to enable Target discovery: {type(e).__name__}: {e}')
+
 	async def _cdp_create_new_page(self, url: str = 'about:blank', background: bool = False, new_window: bool = False) -> str:
 		"""Create a new page/tab using CDP Target.createTarget. Returns target ID."""
 		# Use the root CDP client to create tabs at the browser level
@@ -29,8 +29,8 @@ class BaseWatchdog(BaseModel):
 
 	# Class variables to statically define the list of events relevant to each watchdog
 	# (not enforced, just to make it easier to understand the code and debug watchdogs at runtime)
-	LISTENS_TO: ClassVar[list[type[BaseEvent[Any]]]] = []  # Events this watchdog listens to
-	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = []  # Events this watchdog emits
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent[Any]], ...]] = ()  # Events this watchdog listens to
+	EMITS: ClassVar[tuple[type[BaseEvent[Any]], ...]] = ()  # Events this watchdog emits
 
 	# Core dependencies
 	event_bus: EventBus = Field()
@@ -1,10 +1,12 @@
 """About:blank watchdog for managing about:blank tabs with DVD screensaver."""
 
+import asyncio
+from functools import cached_property
 from typing import TYPE_CHECKING, ClassVar
 
 from bubus import BaseEvent
-from cdp_use.cdp.target import TargetID
-from pydantic import PrivateAttr
+from cdp_use.cdp.target import SessionID, TargetID, TargetInfo
+from pydantic import Field, PrivateAttr
 
 from browser_use.browser.events import (
 	AboutBlankDVDScreensaverShownEvent,
@@ -21,45 +23,255 @@ if TYPE_CHECKING:
 	pass
 
 
+# DVD screensaver JS (from main branch with idempotency added), split around the browser session label so each
+# injection is a plain concatenation instead of re-formatting the whole script
+_DVD_SCRIPT_PREFIX: str = """
+	(function(browser_session_label) {
+		// Idempotency check
+		if (window.__dvdAnimationRunning) {
+			return; // Already running, don't add another
+		}
+		window.__dvdAnimationRunning = true;
+		
+		// Ensure document.body exists before proceeding
+		if (!document.body) {
+			// Try again after DOM is ready
+			window.__dvdAnimationRunning = false; // Reset flag to retry
+			if (document.readyState === 'loading') {
+				document.addEventListener('DOMContentLoaded', () => arguments.callee(browser_session_label));
+			}
+			return;
+		}
+		
+		const animated_title = `Starting Agent Stapply...`;
+		if (document.title === animated_title) {
+			return;      // already run on this tab, dont run again
+		}
+		document.title = animated_title;
+
+			// Create the main overlay
+			const loadingOverlay = document.createElement('div');
+			loadingOverlay.id = 'pretty-loading-animation';
+			loadingOverlay.style.position = 'fixed';
+			loadingOverlay.style.top = '0';
+			loadingOverlay.style.left = '0';
+			loadingOverlay.style.width = '100vw';
+			loadingOverlay.style.height = '100vh';
+			loadingOverlay.style.background = 'radial-gradient(1200px 800px at 20% 20%, #0f172a 0%, #0b1023 40%, #050814 70%, #000 100%)';
+			loadingOverlay.style.zIndex = '99999';
+			loadingOverlay.style.overflow = 'hidden';
+			loadingOverlay.style.opacity = '0';
+			loadingOverlay.style.transition = 'opacity 300ms ease-out';
+
+		// Create the image element
+		const img = document.createElement('img');
+		img.src = 'https://storage.stapply.ai/assets/stapply_white.svg';
+		img.alt = 'Agent Stapply';
+		img.style.width = '200px';
+		img.style.height = 'auto';
+		img.style.position = 'absolute';
+		img.style.left = '0px';
+		img.style.top = '0px';
+		img.style.zIndex = '2';
+			img.style.opacity = '0.9';
+			img.style.filter = 'drop-shadow(0 6px 24px rgba(255,255,255,0.12)) drop-shadow(0 2px 8px rgba(80,160,255,0.25))';
+
+		// Create the text element (center bottom of the screen, always visible, above the image)
+		const text = document.createElement('div');
+		text.id = 'powered-by';
+		text.textContent = 'powered by Browser-Use';
+		text.style.color = '#fff';
+			text.style.fontSize = '14px';
+			text.style.letterSpacing = '0.04em';
+			text.style.fontFamily = 'ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, Noto Sans, Helvetica Neue, Arial, Apple Color Emoji, Segoe UI Emoji';
+		text.style.textAlign = 'center';
+		text.style.position = 'absolute';
+			text.style.bottom = '20px';
+		text.style.left = '50%';
+		text.style.transform = 'translateX(-50%)';
+		text.style.zIndex = '3';
+			text.style.opacity = '0.85';
+
+			// Create the Browser-Use logo element (bottom center, above the image)
+		const browserUseLogo = document.createElement('img');
+		browserUseLogo.id = 'browseruse-logo';
+		browserUseLogo.src = 'https://cf.browser-use.com/logo.svg';
+		browserUseLogo.alt = 'Browser-Use';
+			browserUseLogo.style.width = '90px';
+		browserUseLogo.style.height = 'auto';
+		browserUseLogo.style.position = 'absolute';
+			browserUseLogo.style.left = '50%';
+			browserUseLogo.style.bottom = '48px';
+			browserUseLogo.style.transform = 'translateX(-50%)';
+		browserUseLogo.style.zIndex = '3';
+			browserUseLogo.style.opacity = '0.9';
+			browserUseLogo.style.filter = 'drop-shadow(0 4px 16px rgba(80,160,255,0.35))';
+
+		loadingOverlay.appendChild(img);
+		loadingOverlay.appendChild(text);
+		loadingOverlay.appendChild(browserUseLogo);
+
+			document.body.appendChild(loadingOverlay);
+			// Fade-in
+			requestAnimationFrame(() => { loadingOverlay.style.opacity = '1'; });
+
+
+
+		// DVD screensaver bounce logic with bottom safe area to avoid branding overlap
+		let x = Math.random() * (window.innerWidth - 300);
+		let y = Math.random() * (window.innerHeight - 300);
+		let dx = 1.2 + Math.random() * 0.4; // px per frame
+		let dy = 1.2 + Math.random() * 0.4;
+		// Randomize direction
+		if (Math.random() > 0.5) dx = -dx;
+		if (Math.random() > 0.5) dy = -dy;
+
+		function getBounds(w, h) {
+			const margin = 8; // small breathing room
+			const textEl = document.getElementById('powered-by');
+			const logoEl = document.getElementById('browseruse-logo');
+			const textRect = textEl ? textEl.getBoundingClientRect() : null;
+			const logoRect = logoEl ? logoEl.getBoundingClientRect() : null;
+			let bottomSafeTop = window.innerHeight;
+			if (textRect) bottomSafeTop = Math.min(bottomSafeTop, textRect.top);
+			if (logoRect) bottomSafeTop = Math.min(bottomSafeTop, logoRect.top);
+			const maxX = Math.max(0, window.innerWidth - w);
+			const maxY = Math.max(0, bottomSafeTop - h - margin);
+			return { maxX, maxY };
+		}
+
+		function animate() {
+			const imgWidth = img.offsetWidth || 300;
+			const imgHeight = img.offsetHeight || 300;
+			const { maxX, maxY } = getBounds(imgWidth, imgHeight);
+			x += dx;
+			y += dy;
+
+			if (x <= 0) {
+				x = 0;
+				dx = Math.abs(dx);
+			} else if (x >= maxX) {
+				x = maxX;
+				dx = -Math.abs(dx);
+			}
+			if (y <= 0) {
+				y = 0;
+				dy = Math.abs(dy);
+			} else if (y >= maxY) {
+				y = maxY;
+				dy = -Math.abs(dy);
+			}
+
+			img.style.left = `${x}px`;
+			img.style.top = `${y}px`;
+
+			requestAnimationFrame(animate);
+		}
+		// Ensure initial position respects bounds
+		(function initPosition() {
+			const w = img.offsetWidth || 300;
+			const h = img.offsetHeight || 300;
+			const { maxX, maxY } = getBounds(w, h);
+			x = Math.min(Math.max(0, x), maxX);
+			y = Math.min(Math.max(0, y), maxY);
+		})();
+		animate();
+
+		// Responsive: update bounds on resize
+		window.addEventListener('resize', () => {
+			const w = img.offsetWidth || 300;
+			const h = img.offsetHeight || 300;
+			const { maxX, maxY } = getBounds(w, h);
+			x = Math.min(x, maxX);
+			y = Math.min(y, maxY);
+		});
+
+			// Add a little CSS for smoothness and subtle décor
+		const style = document.createElement('style');
+		style.textContent = `
+			#pretty-loading-animation {
+					/*backdrop-filter: blur(2px) brightness(0.9);*/
+					position: fixed;
+					inset: 0;
+				}
+				#pretty-loading-animation::before {
+					content: '';
+					position: absolute;
+					inset: 0;
+					background: radial-gradient(600px 400px at 80% 80%, rgba(80,160,255,0.12) 0%, rgba(80,160,255,0.04) 40%, transparent 70%)
+						, radial-gradient(800px 600px at 10% 10%, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.03) 35%, transparent 70%);
+					pointer-events: none;
+					z-index: 1;
+			}
+			#pretty-loading-animation img {
+				user-select: none;
+				pointer-events: none;
+			}
+				@media (max-width: 640px) {
+					#pretty-loading-animation img { width: 140px !important; }
+				}
+		`;
+		document.head.appendChild(style);
+	})('"""
+_DVD_SCRIPT_SUFFIX: str = "');\n"
+
+
 class AboutBlankWatchdog(BaseWatchdog):
 	"""Ensures there's always exactly one about:blank tab with DVD screensaver."""
 
 	# Event contracts
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (
 		BrowserStopEvent,
 		BrowserStoppedEvent,
 		TabCreatedEvent,
 		TabClosedEvent,
-	]
-	EMITS: ClassVar[list[type[BaseEvent]]] = [
+	)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = (
 		NavigateToUrlEvent,
 		CloseTabEvent,
 		AboutBlankDVDScreensaverShownEvent,
-	]
+	)
+
+	# Configuration
+	reconcile_debounce_seconds: float = Field(default=0.05)  # Window for coalescing bursts of tab events
 
 	_stopping: bool = PrivateAttr(default=False)
+	_reconcile_pending: bool = PrivateAttr(default=False)
+	_reconcile_task: asyncio.Task | None = PrivateAttr(default=None)
+	_reconcile_closed_target_ids: set[TargetID] = PrivateAttr(default_factory=set)
+	_reconcile_replacement_target_ids: set[TargetID] = PrivateAttr(default_factory=set)
+	# Tabs with the DVD overlay -> (CDP session it was injected through, tracked TargetInfo at the time)
+	_dvd_injected_sessions: dict[TargetID, tuple[SessionID, TargetInfo]] = PrivateAttr(default_factory=dict)
+
+	@cached_property
+	def _session_label(self) -> str:
+		"""Short browser session label shown in the DVD screensaver, stable for the watchdog's lifetime"""
+		return str(self.browser_session.id)[-4:]
 
 	async def on_BrowserStopEvent(self, event: BrowserStopEvent) -> None:
 		"""Handle browser stop request - stop creating new tabs."""
 		# logger.info('[AboutBlankWatchdog] Browser stop requested, stopping tab creation')
 		self._stopping = True
+		self._dvd_injected_sessions.clear()
 
 	async def on_BrowserStoppedEvent(self, event: BrowserStoppedEvent) -> None:
 		"""Handle browser stopped event."""
 		# logger.info('[AboutBlankWatchdog] Browser stopped')
 		self._stopping = True
+		self._dvd_injected_sessions.clear()
 
 	async def on_TabCreatedEvent(self, event: TabCreatedEvent) -> None:
 		"""Check tabs when a new tab is created."""
 		# logger.debug(f'[AboutBlankWatchdog] ➕ New tab created: {event.url}')
 
-		# If an about:blank tab was created, show DVD screensaver on all about:blank tabs
+		# If an about:blank tab was created, show DVD screensaver on it directly, we already know its target_id
 		if event.url == 'about:blank':
-			await self._show_dvd_screensaver_on_about_blank_tabs()
+			await self._show_dvd_screensaver_loading_animation_cdp(event.target_id, self._session_label)
 
 	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
 		"""Check tabs when a tab is closed and proactively create about:blank if needed."""
 		# logger.debug('[AboutBlankWatchdog] Tab closing, checking if we need to create about:blank tab')
+		self._dvd_injected_sessions.pop(event.target_id, None)
 
 		# Don't create new tabs if browser is shutting down
 		if self._stopping:
@@ -67,58 +279,139 @@ class AboutBlankWatchdog(BaseWatchdog):
 			return
 
 		# Check if we're about to close the last tab (event happens BEFORE tab closes)
-		# Use _cdp_get_all_pages for quick check without fetching titles
-		page_targets = await self.browser_session._cdp_get_all_pages()
-		if len(page_targets) <= 1:
+		# Pages are tracked by the session from CDP target events, so this is usually not a CDP round-trip
+		page_targets = await self.browser_session._cdp_get_known_pages()
+		replacement_target_id = None
+		if not any(t['targetId'] != event.target_id for t in page_targets):
 			self.logger.debug(
 				'[AboutBlankWatchdog] Last tab closing, creating new about:blank tab to avoid closing entire browser'
 			)
 			# Create the animation tab since no tabs should remain
-			navigate_event = self.event_bus.dispatch(NavigateToUrlEvent(url='about:blank', new_tab=True))
-			await navigate_event
-			# Show DVD screensaver on the new tab
-			await self._show_dvd_screensaver_on_about_blank_tabs()
-		else:
-			# Multiple tabs exist, check after close
-			await self._check_and_ensure_about_blank_tab()
+			replacement_target_id = await self._navigate_to_about_blank_with_dvd_screensaver()
+
+		# Check again once the tab is actually closed (batched with other tab events)
+		self._schedule_reconcile(closed_target_id=event.target_id, replacement_target_id=replacement_target_id)
 
 	async def attach_to_target(self, target_id: TargetID) -> None:
 		"""AboutBlankWatchdog doesn't monitor individual targets."""
 		pass
 
-	async def _check_and_ensure_about_blank_tab(self) -> None:
-		"""Check current tabs and ensure exactly one about:blank tab with animation exists."""
+	def _schedule_reconcile(
+		self, closed_target_id: TargetID | None = None, replacement_target_id: TargetID | None = None
+	) -> None:
+		"""Queue a reconcile of about:blank tabs, coalescing bursts of tab events into one CDP pass."""
+		if closed_target_id:
+			self._reconcile_closed_target_ids.add(closed_target_id)
+		if replacement_target_id:
+			self._reconcile_replacement_target_ids.add(replacement_target_id)
+		self._reconcile_pending = True
+		if self._reconcile_task is None or self._reconcile_task.done():
+			self._reconcile_task = asyncio.create_task(self._flush_after(self.reconcile_debounce_seconds))
+
+	async def _flush_after(self, delay: float) -> None:
+		"""Wait for tab events to settle, then reconcile all of them with a single page targets lookup."""
+		# Events that arrive while a flush is running get picked up by another pass of the loop
+		while self._reconcile_pending:
+			await asyncio.sleep(delay)
+			self._reconcile_pending = False
+			closed_target_ids, self._reconcile_closed_target_ids = self._reconcile_closed_target_ids, set()
+			replacement_target_ids, self._reconcile_replacement_target_ids = self._reconcile_replacement_target_ids, set()
+
+			if self._stopping:
+				return
+
+			try:
+				# Closed tabs may still be listed, TabClosedEvent is dispatched before the target is closed
+				page_targets = [
+					t for t in await self.browser_session._cdp_get_known_pages() if t['targetId'] not in closed_target_ids
+				]
+			except Exception as e:
+				self.logger.error(f'[AboutBlankWatchdog] Error fetching page targets: {e}')
+				continue
+
+			await self._check_and_ensure_about_blank_tab(page_targets=page_targets, replacement_target_ids=replacement_target_ids)
+			await self._show_dvd_screensaver_on_about_blank_tabs(page_targets=page_targets)
+
+	async def _check_and_ensure_about_blank_tab(
+		self,
+		page_targets: list[TargetInfo] | None = None,
+		replacement_target_ids: set[TargetID] | None = None,
+	) -> None:
+		"""Check current tabs and ensure exactly one about:blank tab with animation exists.
+
+		Pass page_targets if the caller already fetched them to avoid a redundant CDP round-trip.
+		replacement_target_ids (tabs newly created to replace a closing last tab) are closed again if
+		other tabs turned out to be open by the time the close went through.
+		"""
 		try:
 			# For quick checks, just get page targets without titles to reduce noise
-			page_targets = await self.browser_session._cdp_get_all_pages()
+			if page_targets is None:
+				page_targets = await self.browser_session._cdp_get_known_pages()
 
 			# If no tabs exist at all, create one to keep browser alive
 			if len(page_targets) == 0:
+				if self._stopping:
+					return
 				# Only create a new tab if there are no tabs at all
 				self.logger.debug('[AboutBlankWatchdog] No tabs exist, creating new about:blank DVD screensaver tab')
-				navigate_event = self.event_bus.dispatch(NavigateToUrlEvent(url='about:blank', new_tab=True))
-				await navigate_event
-				# Show DVD screensaver on the new tab
-				await self._show_dvd_screensaver_on_about_blank_tabs()
+				await self._navigate_to_about_blank_with_dvd_screensaver()
+			elif replacement_target_ids and any(t['targetId'] not in replacement_target_ids for t in page_targets):
+				# Another tab appeared while the last one was closing, so the replacement tabs are surplus,
+				# unless the agent has already navigated or focused one of them
+				agent_focus = self.browser_session.agent_focus
+				focused_target_id = agent_focus.target_id if agent_focus else None
+				for t in page_targets:
+					if (
+						t['targetId'] in replacement_target_ids
+						and t['url'] == 'about:blank'
+						and t['targetId'] != focused_target_id
+					):
+						self.logger.debug(
+							f'[AboutBlankWatchdog] Other tabs still open, closing surplus about:blank tab #{t["targetId"][-4:]}'
+						)
+						self.event_bus.dispatch(CloseTabEvent(target_id=t['targetId']))
 			# Otherwise there are tabs, don't create new ones to avoid interfering
 
 		except Exception as e:
 			self.logger.error(f'[AboutBlankWatchdog] Error ensuring about:blank tab: {e}')
 
-	async def _show_dvd_screensaver_on_about_blank_tabs(self) -> None:
-		"""Show DVD screensaver on all about:blank pages only."""
-		try:
-			# Get just the page targets without expensive title fetching
-			page_targets = await self.browser_session._cdp_get_all_pages()
-			browser_session_label = str(self.browser_session.id)[-4:]
-
-			for page_target in page_targets:
-				target_id = page_target['targetId']
-				url = page_target['url']
+	async def _navigate_to_about_blank_with_dvd_screensaver(self) -> TargetID | None:
+		"""Open a new about:blank tab and show the DVD screensaver on it once the navigation has completed.
 
-				# Only target about:blank pages specifically
-				if url == 'about:blank':
-					await self._show_dvd_screensaver_loading_animation_cdp(target_id, browser_session_label)
+		Returns the target ID of the tab if the navigate created a new one, or None if it reused an existing tab
+		(which may belong to the user) or the browser is not connected.
+		"""
+		existing_target_ids = {t['targetId'] for t in await self.browser_session._cdp_get_known_pages()}
+		navigate_event = self.event_bus.dispatch(NavigateToUrlEvent(url='about:blank', new_tab=True))
+		await navigate_event
+
+		# The navigate handler switches agent focus to the tab it navigated
+		if not self.browser_session.agent_focus:
+			return None
+		target_id = self.browser_session.agent_focus.target_id
+		# No-op if the TabCreatedEvent handler already covered this tab
+		await self._show_dvd_screensaver_loading_animation_cdp(target_id, self._session_label)
+		return None if target_id in existing_target_ids else target_id
+
+	async def _show_dvd_screensaver_on_about_blank_tabs(self, page_targets: list[TargetInfo] | None = None) -> None:
+		"""Show DVD screensaver on all about:blank pages only.
+
+		Pass page_targets if the caller already holds an up-to-date list to skip refetching it over CDP.
+		"""
+		try:
+			# Pages are tracked locally by the session, so usually no CDP round-trip
+			if page_targets is None:
+				page_targets = await self.browser_session._cdp_get_known_pages()
+
+			# Only target about:blank pages specifically, injecting into all of them concurrently
+			# (each injection logs its own errors, so one failing tab doesn't affect the others)
+			await asyncio.gather(
+				*(
+					self._show_dvd_screensaver_loading_animation_cdp(page_target['targetId'], self._session_label)
+					for page_target in page_targets
+					if page_target['url'] == 'about:blank'
+				)
+			)
 
 		except Exception as e:
 			self.logger.error(f'[AboutBlankWatchdog] Error showing DVD screensaver: {e}')
@@ -128,207 +421,42 @@ class AboutBlankWatchdog(BaseWatchdog):
 		Injects a DVD screensaver-style bouncing logo loading animation overlay into the target using CDP.
 		This is used to visually indicate that the browser is setting up or waiting.
 		"""
+		# Already injected into this tab's current document through the same (still cached) CDP session,
+		# skip the CDP round-trip entirely. A different or missing session means the tab was re-attached, and a
+		# different TargetInfo means Target.targetInfoChanged reported a navigation/reload (url or title change)
+		# since then, including ones that never went through the event bus (Page.reload, history navigation).
+		cached_session = self.browser_session._cdp_session_pool.get(target_id)
+		known_targets = self.browser_session._known_targets
+		current_info = known_targets.get(target_id) if known_targets is not None else None
+		injected = self._dvd_injected_sessions.get(target_id)
+		if (
+			cached_session
+			and current_info is not None
+			and injected is not None
+			and injected[0] == cached_session.session_id
+			and injected[1] is current_info
+		):
+			return
+
 		try:
 			# Create temporary session for this target without switching focus
 			temp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
 
-			# Inject the DVD screensaver script (from main branch with idempotency added)
-			script = f"""
-				(function(browser_session_label) {{
-					// Idempotency check
-					if (window.__dvdAnimationRunning) {{
-						return; // Already running, don't add another
-					}}
-					window.__dvdAnimationRunning = true;
-					
-					// Ensure document.body exists before proceeding
-					if (!document.body) {{
-						// Try again after DOM is ready
-						window.__dvdAnimationRunning = false; // Reset flag to retry
-						if (document.readyState === 'loading') {{
-							document.addEventListener('DOMContentLoaded', () => arguments.callee(browser_session_label));
-						}}
-						return;
-					}}
-					
-					const animated_title = `Starting Agent Stapply...`;
-					if (document.title === animated_title) {{
-						return;      // already run on this tab, dont run again
-					}}
-					document.title = animated_title;
-
-						// Create the main overlay
-						const loadingOverlay = document.createElement('div');
-						loadingOverlay.id = 'pretty-loading-animation';
-						loadingOverlay.style.position = 'fixed';
-						loadingOverlay.style.top = '0';
-						loadingOverlay.style.left = '0';
-						loadingOverlay.style.width = '100vw';
-						loadingOverlay.style.height = '100vh';
-						loadingOverlay.style.background = 'radial-gradient(1200px 800px at 20% 20%, #0f172a 0%, #0b1023 40%, #050814 70%, #000 100%)';
-						loadingOverlay.style.zIndex = '99999';
-						loadingOverlay.style.overflow = 'hidden';
-						loadingOverlay.style.opacity = '0';
-						loadingOverlay.style.transition = 'opacity 300ms ease-out';
-
-					// Create the image element
-					const img = document.createElement('img');
-					img.src = 'https://storage.stapply.ai/assets/stapply_white.svg';
-					img.alt = 'Agent Stapply';
-					img.style.width = '200px';
-					img.style.height = 'auto';
-					img.style.position = 'absolute';
-					img.style.left = '0px';
-					img.style.top = '0px';
-					img.style.zIndex = '2';
-						img.style.opacity = '0.9';
-						img.style.filter = 'drop-shadow(0 6px 24px rgba(255,255,255,0.12)) drop-shadow(0 2px 8px rgba(80,160,255,0.25))';
-
-					// Create the text element (center bottom of the screen, always visible, above the image)
-					const text = document.createElement('div');
-					text.id = 'powered-by';
-					text.textContent = 'powered by Browser-Use';
-					text.style.color = '#fff';
-						text.style.fontSize = '14px';
-						text.style.letterSpacing = '0.04em';
-						text.style.fontFamily = 'ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, Noto Sans, Helvetica Neue, Arial, Apple Color Emoji, Segoe UI Emoji';
-					text.style.textAlign = 'center';
-					text.style.position = 'absolute';
-						text.style.bottom = '20px';
-					text.style.left = '50%';
-					text.style.transform = 'translateX(-50%)';
-					text.style.zIndex = '3';
-						text.style.opacity = '0.85';
-
-						// Create the Browser-Use logo element (bottom center, above the image)
-					const browserUseLogo = document.createElement('img');
-					browserUseLogo.id = 'browseruse-logo';
-					browserUseLogo.src = 'https://cf.browser-use.com/logo.svg';
-					browserUseLogo.alt = 'Browser-Use';
-						browserUseLogo.style.width = '90px';
-					browserUseLogo.style.height = 'auto';
-					browserUseLogo.style.position = 'absolute';
-						browserUseLogo.style.left = '50%';
-						browserUseLogo.style.bottom = '48px';
-						browserUseLogo.style.transform = 'translateX(-50%)';
-					browserUseLogo.style.zIndex = '3';
-						browserUseLogo.style.opacity = '0.9';
-						browserUseLogo.style.filter = 'drop-shadow(0 4px 16px rgba(80,160,255,0.35))';
-
-					loadingOverlay.appendChild(img);
-					loadingOverlay.appendChild(text);
-					loadingOverlay.appendChild(browserUseLogo);
-
-						document.body.appendChild(loadingOverlay);
-						// Fade-in
-						requestAnimationFrame(() => {{ loadingOverlay.style.opacity = '1'; }});
-
-
-
-					// DVD screensaver bounce logic with bottom safe area to avoid branding overlap
-					let x = Math.random() * (window.innerWidth - 300);
-					let y = Math.random() * (window.innerHeight - 300);
-					let dx = 1.2 + Math.random() * 0.4; // px per frame
-					let dy = 1.2 + Math.random() * 0.4;
-					// Randomize direction
-					if (Math.random() > 0.5) dx = -dx;
-					if (Math.random() > 0.5) dy = -dy;
-
-					function getBounds(w, h) {{
-						const margin = 8; // small breathing room
-						const textEl = document.getElementById('powered-by');
-						const logoEl = document.getElementById('browseruse-logo');
-						const textRect = textEl ? textEl.getBoundingClientRect() : null;
-						const logoRect = logoEl ? logoEl.getBoundingClientRect() : null;
-						let bottomSafeTop = window.innerHeight;
-						if (textRect) bottomSafeTop = Math.min(bottomSafeTop, textRect.top);
-						if (logoRect) bottomSafeTop = Math.min(bottomSafeTop, logoRect.top);
-						const maxX = Math.max(0, window.innerWidth - w);
-						const maxY = Math.max(0, bottomSafeTop - h - margin);
-						return {{ maxX, maxY }};
-					}}
-
-					function animate() {{
-						const imgWidth = img.offsetWidth || 300;
-						const imgHeight = img.offsetHeight || 300;
-						const {{ maxX, maxY }} = getBounds(imgWidth, imgHeight);
-						x += dx;
-						y += dy;
-
-						if (x <= 0) {{
-							x = 0;
-							dx = Math.abs(dx);
-						}} else if (x >= maxX) {{
-							x = maxX;
-							dx = -Math.abs(dx);
-						}}
-						if (y <= 0) {{
-							y = 0;
-							dy = Math.abs(dy);
-						}} else if (y >= maxY) {{
-							y = maxY;
-							dy = -Math.abs(dy);
-						}}
-
-						img.style.left = `${{x}}px`;
-						img.style.top = `${{y}}px`;
-
-						requestAnimationFrame(animate);
-					}}
-					// Ensure initial position respects bounds
-					(function initPosition() {{
-						const w = img.offsetWidth || 300;
-						const h = img.offsetHeight || 300;
-						const {{ maxX, maxY }} = getBounds(w, h);
-						x = Math.min(Math.max(0, x), maxX);
-						y = Math.min(Math.max(0, y), maxY);
-					}})();
-					animate();
-
-					// Responsive: update bounds on resize
-					window.addEventListener('resize', () => {{
-						const w = img.offsetWidth || 300;
-						const h = img.offsetHeight || 300;
-						const {{ maxX, maxY }} = getBounds(w, h);
-						x = Math.min(x, maxX);
-						y = Math.min(y, maxY);
-					}});
-
-						// Add a little CSS for smoothness and subtle décor
-					const style = document.createElement('style');
-					style.textContent = `
-						#pretty-loading-animation {{
-								/*backdrop-filter: blur(2px) brightness(0.9);*/
-								position: fixed;
-								inset: 0;
-							}}
-							#pretty-loading-animation::before {{
-								content: '';
-								position: absolute;
-								inset: 0;
-								background: radial-gradient(600px 400px at 80% 80%, rgba(80,160,255,0.12) 0%, rgba(80,160,255,0.04) 40%, transparent 70%)
-									, radial-gradient(800px 600px at 10% 10%, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.03) 35%, transparent 70%);
-								pointer-events: none;
-								z-index: 1;
-						}}
-						#pretty-loading-animation img {{
-							user-select: none;
-							pointer-events: none;
-						}}
-							@media (max-width: 640px) {{
-								#pretty-loading-animation img {{ width: 140px !important; }}
-							}}
-					`;
-					document.head.appendChild(style);
-				}})('{browser_session_label}');
-			"""
-
+			script = self._get_dvd_screensaver_script(browser_session_label)
 			await temp_session.cdp_client.send.Runtime.evaluate(params={'expression': script}, session_id=temp_session.session_id)
 
-			# No need to detach - session is cached
+			# No need to detach - session is cached. Without Target discovery there is nothing to tell when the
+			# document changes, so the injection is not memoized (the script itself is idempotent).
+			if known_targets is not None and target_id in known_targets:
+				self._dvd_injected_sessions[target_id] = (temp_session.session_id, known_targets[target_id])
 
 			# Dispatch event
 			self.event_bus.dispatch(AboutBlankDVDScreensaverShownEvent(target_id=target_id))
 
 		except Exception as e:
 			self.logger.error(f'[AboutBlankWatchdog] Error injecting DVD screensaver: {e}')
+
+	@staticmethod
+	def _get_dvd_screensaver_script(browser_session_label: str) -> str:
+		"""Build the DVD screensaver JS for the given browser session label."""
+		return _DVD_SCRIPT_PREFIX + browser_session_label + _DVD_SCRIPT_SUFFIX
@@ -37,12 +37,12 @@ class CrashWatchdog(BaseWatchdog):
 	"""Monitors browser health for crashes and network timeouts using CDP."""
 
 	# Event contracts
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (
 		BrowserConnectedEvent,
 		BrowserStoppedEvent,
 		TabCreatedEvent,
-	]
-	EMITS: ClassVar[list[type[BaseEvent]]] = [BrowserErrorEvent]
+	)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = (BrowserErrorEvent,)
 
 	# Configuration
 	network_timeout_seconds: float = Field(default=10.0)
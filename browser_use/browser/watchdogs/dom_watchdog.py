@@ -31,8 +31,8 @@ class DOMWatchdog(BaseWatchdog):
 	helper methods for other watchdogs.
 	"""
 
-	LISTENS_TO = [TabCreatedEvent, BrowserStateRequestEvent]
-	EMITS = [BrowserErrorEvent]
+	LISTENS_TO = (TabCreatedEvent, BrowserStateRequestEvent)
+	EMITS = (BrowserErrorEvent,)
 
 	# Public properties for other watchdogs
 	selector_map: dict[int, EnhancedDOMTreeNode] | None = None
@@ -33,19 +33,17 @@ class DownloadsWatchdog(BaseWatchdog):
 	"""Monitors downloads and handles file download events."""
 
 	# Events this watchdog listens to (for documentation)
-	LISTENS_TO: ClassVar[list[type[BaseEvent[Any]]]] = [
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent[Any]], ...]] = (
 		BrowserLaunchEvent,
 		BrowserStateRequestEvent,
 		BrowserStoppedEvent,
 		TabCreatedEvent,
 		TabClosedEvent,
 		NavigationCompleteEvent,
-	]
+	)
 
 	# Events this watchdog emits
-	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = [
-		FileDownloadedEvent,
-	]
+	EMITS: ClassVar[tuple[type[BaseEvent[Any]], ...]] = (FileDownloadedEvent,)
 
 	# Private state
 	_sessions_with_listeners: set[str] = PrivateAttr(default_factory=set)  # Track sessions that already have download listeners
@@ -28,14 +28,14 @@ class LocalBrowserWatchdog(BaseWatchdog):
 	"""Manages local browser subprocess lifecycle."""
 
 	# Events this watchdog listens to
-	LISTENS_TO: ClassVar[list[type[BaseEvent[Any]]]] = [
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent[Any]], ...]] = (
 		BrowserLaunchEvent,
 		BrowserKillEvent,
 		BrowserStopEvent,
-	]
+	)
 
 	# Events this watchdog emits
-	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = []
+	EMITS: ClassVar[tuple[type[BaseEvent[Any]], ...]] = ()
 
 	# Private state for subprocess management
 	_subprocess: psutil.Process | None = PrivateAttr(default=None)
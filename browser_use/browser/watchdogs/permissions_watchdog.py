@@ -15,10 +15,8 @@ class PermissionsWatchdog(BaseWatchdog):
 	"""Grants browser permissions when browser connects."""
 
 	# Event contracts
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
-		BrowserConnectedEvent,
-	]
-	EMITS: ClassVar[list[type[BaseEvent]]] = []
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (BrowserConnectedEvent,)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = ()
 
 	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
 		"""Grant permissions when browser connects."""
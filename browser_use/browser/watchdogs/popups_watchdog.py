@@ -14,8 +14,8 @@ class PopupsWatchdog(BaseWatchdog):
 	"""Handles JavaScript dialogs (alert, confirm, prompt) by automatically accepting them immediately."""
 
 	# Events this watchdog listens to and emits
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [TabCreatedEvent]
-	EMITS: ClassVar[list[type[BaseEvent]]] = []
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (TabCreatedEvent,)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = ()
 
 	# Track which targets have dialog handlers registered
 	_dialog_listeners_registered: set[str] = PrivateAttr(default_factory=set)
@@ -19,8 +19,8 @@ class RecordingWatchdog(BaseWatchdog):
 	Manages video recording of a browser session using CDP screencasting.
 	"""
 
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [BrowserConnectedEvent, BrowserStopEvent]
-	EMITS: ClassVar[list[type[BaseEvent]]] = []
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (BrowserConnectedEvent, BrowserStopEvent)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = ()
 
 	_recorder: VideoRecorderService | None = None
 
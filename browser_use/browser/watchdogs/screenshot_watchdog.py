@@ -18,10 +18,10 @@ class ScreenshotWatchdog(BaseWatchdog):
 	"""Handles screenshot requests using CDP."""
 
 	# Events this watchdog listens to
-	LISTENS_TO: ClassVar[list[type[BaseEvent[Any]]]] = [ScreenshotEvent]
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent[Any]], ...]] = (ScreenshotEvent,)
 
 	# Events this watchdog emits
-	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = []
+	EMITS: ClassVar[tuple[type[BaseEvent[Any]], ...]] = ()
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='screenshot_event_handler')
 	async def on_ScreenshotEvent(self, event: ScreenshotEvent) -> str:
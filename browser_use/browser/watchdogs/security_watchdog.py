@@ -23,14 +23,12 @@ class SecurityWatchdog(BaseWatchdog):
 	"""Monitors and enforces security policies for URL access."""
 
 	# Event contracts
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (
 		NavigateToUrlEvent,
 		NavigationCompleteEvent,
 		TabCreatedEvent,
-	]
-	EMITS: ClassVar[list[type[BaseEvent]]] = [
-		BrowserErrorEvent,
-	]
+	)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = (BrowserErrorEvent,)
 
 	async def on_NavigateToUrlEvent(self, event: NavigateToUrlEvent) -> None:
 		"""Check if navigation URL is allowed before navigation starts."""
@@ -25,16 +25,16 @@ class StorageStateWatchdog(BaseWatchdog):
 	"""Monitors and persists browser storage state including cookies and localStorage."""
 
 	# Event contracts
-	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
+	LISTENS_TO: ClassVar[tuple[type[BaseEvent], ...]] = (
 		BrowserConnectedEvent,
 		BrowserStopEvent,
 		SaveStorageStateEvent,
 		LoadStorageStateEvent,
-	]
-	EMITS: ClassVar[list[type[BaseEvent]]] = [
+	)
+	EMITS: ClassVar[tuple[type[BaseEvent], ...]] = (
 		StorageStateSavedEvent,
 		StorageStateLoadedEvent,
-	]
+	)
 
 	# Configuration
 	auto_save_interval: float = Field(default=30.0)  # Auto-save every 30 seconds
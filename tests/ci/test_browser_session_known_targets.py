@@ -0,0 +1,83 @@
+"""Test that BrowserSession._known_targets follows page targets as they are created, navigated and closed."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+
+
+@pytest.fixture(scope='module')
+def http_server():
+	"""Create and provide a test HTTP server that serves static content."""
+	server = HTTPServer()
+	server.start()
+
+	for i in range(1, 3):
+		server.expect_request(f'/page{i}').respond_with_data(
+			f'<html><head><title>Test Page {i}</title></head><body><h1>Test Page {i}</h1></body></html>',
+			content_type='text/html',
+		)
+
+	yield server
+	server.stop()
+
+
+@pytest.fixture(scope='module')
+def base_url(http_server):
+	"""Return the base URL for the test HTTP server."""
+	return f'http://{http_server.host}:{http_server.port}'
+
+
+@pytest.fixture
+async def browser_session():
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(
+			user_data_dir=None,
+			headless=True,
+			keep_alive=True,
+		)
+	)
+	await browser_session.start()
+	yield browser_session
+	await browser_session.kill()
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+	"""Poll until condition() holds, target events arrive asynchronously from the browser."""
+	deadline = asyncio.get_running_loop().time() + timeout
+	while not condition():
+		assert asyncio.get_running_loop().time() < deadline, 'timed out waiting for target events'
+		await asyncio.sleep(0.05)
+
+
+async def test_known_targets_follow_create_navigate_and_close(browser_session, base_url):
+	"""The locally tracked targets should match Target.getTargets after each tab lifecycle step."""
+	known_targets = browser_session._known_targets
+	assert known_targets is not None, 'Target discovery should be enabled on connect'
+
+	async def known_page_ids() -> set[str]:
+		return {t['targetId'] for t in await browser_session._cdp_get_known_pages()}
+
+	async def all_page_ids() -> set[str]:
+		return {t['targetId'] for t in await browser_session._cdp_get_all_pages()}
+
+	assert await known_page_ids() == await all_page_ids()
+
+	# Create
+	target_id = await browser_session._cdp_create_new_page(f'{base_url}/page1')
+	await wait_until(lambda: target_id in known_targets and known_targets[target_id]['url'].endswith('/page1'))
+	assert await known_page_ids() == await all_page_ids()
+
+	# Navigate (URL change is picked up from Target.targetInfoChanged)
+	await browser_session._cdp_navigate(f'{base_url}/page2', target_id=target_id)
+	await wait_until(lambda: known_targets[target_id]['url'].endswith('/page2'))
+	assert await known_page_ids() == await all_page_ids()
+
+	# Close
+	await browser_session._cdp_close_page(target_id)
+	await wait_until(lambda: target_id not in known_targets)
+	assert await known_page_ids() == await all_page_ids()
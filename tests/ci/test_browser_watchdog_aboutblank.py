@@ -0,0 +1,161 @@
+"""Test AboutBlankWatchdog tab reconciliation: debounced reconcile, last-tab replacement, and never closing user tabs."""
+
+import asyncio
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser.events import CloseTabEvent, NavigateToUrlEvent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.aboutblank_watchdog import AboutBlankWatchdog
+
+
+@pytest.fixture(scope='module')
+def http_server():
+	"""Create and provide a test HTTP server that serves static content."""
+	server = HTTPServer()
+	server.start()
+
+	for i in range(1, 5):
+		server.expect_request(f'/page{i}').respond_with_data(
+			f'<html><head><title>Test Page {i}</title></head><body><h1>Test Page {i}</h1></body></html>',
+			content_type='text/html',
+		)
+
+	yield server
+	server.stop()
+
+
+@pytest.fixture(scope='module')
+def base_url(http_server):
+	"""Return the base URL for the test HTTP server."""
+	return f'http://{http_server.host}:{http_server.port}'
+
+
+@pytest.fixture
+async def browser_session():
+	"""Create a fresh BrowserSession per test, since these tests open and close all of its tabs."""
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(
+			user_data_dir=None,
+			headless=True,
+			keep_alive=True,
+		)
+	)
+	await browser_session.start()
+	yield browser_session
+	await browser_session.kill()
+
+
+def get_watchdog(browser_session: BrowserSession) -> AboutBlankWatchdog:
+	watchdog = browser_session._aboutblank_watchdog
+	assert isinstance(watchdog, AboutBlankWatchdog)
+	return watchdog
+
+
+async def wait_for_reconcile(watchdog: AboutBlankWatchdog) -> None:
+	"""Wait until any pending debounced reconcile has finished."""
+	task = watchdog._reconcile_task
+	if task is not None:
+		await asyncio.wait_for(task, timeout=10)
+
+
+async def open_tab(browser_session: BrowserSession, url: str) -> str:
+	"""Open url in a new tab and return its target_id."""
+	event = browser_session.event_bus.dispatch(NavigateToUrlEvent(url=url, new_tab=True))
+	await event
+	await event.event_result(raise_if_any=True, raise_if_none=False)
+	assert browser_session.agent_focus is not None
+	return browser_session.agent_focus.target_id
+
+
+async def close_tab(browser_session: BrowserSession, target_id: str) -> None:
+	event = browser_session.event_bus.dispatch(CloseTabEvent(target_id=target_id))
+	await event
+
+
+async def test_burst_of_tab_closes_reconciles_once(browser_session, base_url, monkeypatch):
+	"""Several tabs closed in quick succession should be reconciled by a single pass over the page list."""
+	watchdog = get_watchdog(browser_session)
+	# Wide debounce window so the burst reliably lands inside it, regardless of machine speed
+	watchdog.reconcile_debounce_seconds = 1.0
+
+	await open_tab(browser_session, f'{base_url}/page1')
+	burst_tab_ids = [await open_tab(browser_session, f'{base_url}/page{i}') for i in range(2, 5)]
+	await wait_for_reconcile(watchdog)
+
+	ensure_calls = 0
+	original_ensure = AboutBlankWatchdog._check_and_ensure_about_blank_tab
+
+	async def counting_ensure(self, *args, **kwargs):
+		nonlocal ensure_calls
+		ensure_calls += 1
+		return await original_ensure(self, *args, **kwargs)
+
+	monkeypatch.setattr(AboutBlankWatchdog, '_check_and_ensure_about_blank_tab', counting_ensure)
+
+	close_events = [browser_session.event_bus.dispatch(CloseTabEvent(target_id=target_id)) for target_id in burst_tab_ids]
+	for event in close_events:
+		await event
+	await wait_for_reconcile(watchdog)
+
+	assert ensure_calls == 1
+
+	page_ids = {t['targetId'] for t in await browser_session._cdp_get_all_pages()}
+	assert not page_ids & set(burst_tab_ids)
+
+
+async def test_closing_last_tab_leaves_exactly_one_about_blank_tab(browser_session, base_url):
+	"""Closing the last remaining tab should replace it with exactly one about:blank tab instead of closing the browser."""
+	watchdog = get_watchdog(browser_session)
+
+	last_tab_id = await open_tab(browser_session, f'{base_url}/page1')
+	for target in await browser_session._cdp_get_all_pages():
+		if target['targetId'] != last_tab_id:
+			await close_tab(browser_session, target['targetId'])
+	await wait_for_reconcile(watchdog)
+	assert [t['targetId'] for t in await browser_session._cdp_get_all_pages()] == [last_tab_id]
+
+	await close_tab(browser_session, last_tab_id)
+	await wait_for_reconcile(watchdog)
+
+	pages = await browser_session._cdp_get_all_pages()
+	assert len(pages) == 1
+	assert pages[0]['url'] == 'about:blank'
+	assert pages[0]['targetId'] != last_tab_id
+
+
+async def test_tab_closed_outside_event_bus_still_replaces_last_tab(browser_session, base_url):
+	"""Tabs closed without a CloseTabEvent (window.close(), user, crash) must not hide that the last tab is closing."""
+	watchdog = get_watchdog(browser_session)
+
+	last_tab_id = await open_tab(browser_session, f'{base_url}/page1')
+	for target in await browser_session._cdp_get_all_pages():
+		if target['targetId'] != last_tab_id:
+			# Close behind the watchdog's back, no TabClosedEvent is dispatched for these
+			await browser_session._cdp_close_page(target['targetId'])
+	await asyncio.sleep(0.5)  # let Target.targetDestroyed arrive
+	await wait_for_reconcile(watchdog)
+
+	await close_tab(browser_session, last_tab_id)
+	await wait_for_reconcile(watchdog)
+
+	pages = await browser_session._cdp_get_all_pages()
+	assert len(pages) == 1
+	assert pages[0]['url'] == 'about:blank'
+
+
+async def test_navigate_reusing_existing_about_blank_tab_reports_no_replacement(browser_session, base_url):
+	"""A navigate that reuses an existing (possibly user-owned) about:blank tab must not report it as a replacement tab."""
+	watchdog = get_watchdog(browser_session)
+
+	await open_tab(browser_session, f'{base_url}/page1')
+	user_blank_tab_id = await browser_session._cdp_create_new_page('about:blank', background=True)
+	await asyncio.sleep(0.5)  # let Target.targetCreated arrive
+
+	# Only tabs reported here are ever closed as surplus by the reconcile
+	replacement_target_id = await watchdog._navigate_to_about_blank_with_dvd_screensaver()
+	assert replacement_target_id is None
+	assert browser_session.agent_focus is not None
+	assert browser_session.agent_focus.target_id == user_blank_tab_id